@@ -64,7 +64,7 @@ class SearchAgent:
             raise AIModelError(f"Model execution failed: {e}")
 
     @log_execution_time()
-    @retry_with_backoff(max_retries=3, base_delay=1.0)
+    @retry_with_backoff(max_retries=3, base_delay=1.0, retry_on=(ExtractionError,))
     def extract_company_profile(
         self, company_name: str, enhanced_prompt: Optional[str] = None
     ) -> Dict[str, Any]:
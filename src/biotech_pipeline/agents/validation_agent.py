@@ -126,7 +126,7 @@ class ValidationAgent:
                     'field': vr.field,
                     'value': vr.value,
                     'is_valid': vr.is_valid,
-                    'severity': vr.severity.value,
+                    'severity': vr.severity.name,
                     'message': vr.message,
                     'suggested_value': vr.suggested_value
                 })
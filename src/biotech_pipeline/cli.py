@@ -5,14 +5,13 @@ Command-line interface for the BiD ETL Pipeline
 import sys
 import argparse
 import logging.config
-import yaml
 from pathlib import Path
 import os
-from src.biotech_pipeline.utils.logger import VersionFilter
-from src.biotech_pipeline.utils.config import config_manager
+from src.biotech_pipeline.utils.logger import reconfigure_logging
+from src.biotech_pipeline.utils.config import config_manager, load_yaml
 from src.biotech_pipeline.pipeline.etl_orchestrator import ETLOrchestrator
 from src.biotech_pipeline.utils.exceptions import ConfigurationError
-from src.biotech_pipeline.utils.exporter import export_tables_to_excel
+from src.biotech_pipeline.utils.exporter import export_tables_to_excel, export_tables_to_csv
 
 def setup_logging_from_yaml(path: str):
     """
@@ -22,8 +21,7 @@ def setup_logging_from_yaml(path: str):
     if not config_file.is_file():
         raise FileNotFoundError(f"Logging config not found: {path}")
 
-    with open(config_file, "r") as f:
-        logging_config = yaml.safe_load(f)
+    logging_config = load_yaml(config_file)
     
     # Create log directories from handlers that write to file
     for handler in logging_config.get("handlers", {}).values():
@@ -31,22 +29,18 @@ def setup_logging_from_yaml(path: str):
             log_path = Path(handler["filename"]).parent
             os.makedirs(log_path, exist_ok=True)
 
-    logging.config.dictConfig(logging_config)
-    
-    # Attach VersionFilter so %(version)s is available in all log records for every handler
-    for logger_name, logger_obj in logging.root.manager.loggerDict.items():
-        if isinstance(logger_obj, logging.Logger):
-            for handler in logger_obj.handlers:
-                handler.addFilter(VersionFilter())
-    for handler in logging.getLogger().handlers:
-        handler.addFilter(VersionFilter())
+    # Stops the old listener, applies the config, attaches VersionFilter so
+    # %(version)s is available for every handler, and re-queues the handlers
+    reconfigure_logging(logging_config, version_filter=True)
 
 
 def main():
     parser = argparse.ArgumentParser(description="BiD Indian BT Startups ETL Pipeline")
-    parser.add_argument("command", choices=["run", "export"], help="Command to execute")
-    parser.add_argument("--input", "-i", required=True,
-                        help="Path to company list Excel file")
+    parser.add_argument("command", choices=["run", "export", "export-csv"], help="Command to execute")
+    parser.add_argument("--input", "-i",
+                        help="Path to company list Excel file (run)")
+    parser.add_argument("--output", "-o",
+                        help="Excel file to write (export) or directory for CSV files (export-csv)")
     parser.add_argument("--config", "-c", default="config/pipeline_config.yaml",
                         help="Path to pipeline config YAML")
     parser.add_argument("--logging", "-l", default="config/logging.yaml",
@@ -54,6 +48,10 @@ def main():
     parser.add_argument("--mode", choices=["pilot", "production"], default="production",
                         help="Execution mode")
     args = parser.parse_args()
+    if args.command == "run" and not args.input:
+        parser.error("the run command requires --input/-i")
+    if args.command in ("export", "export-csv") and not args.output:
+        parser.error(f"the {args.command} command requires --output/-o")
 
     # Load external logging config first with error handling
     try:
@@ -84,12 +82,18 @@ def main():
             sys.exit(1)
     elif args.command == "export":
         export_cfg = cfg.export
-        output_file = args.input
+        output_file = args.output
         try:
             export_tables_to_excel(output_file, export_cfg.tables)
         except Exception as e:
             logging.getLogger(__name__).critical(f"Data export failed: {e}", exc_info=True)
             sys.exit(1)
+    elif args.command == "export-csv":
+        try:
+            export_tables_to_csv(args.output, cfg.export.tables)
+        except Exception as e:
+            logging.getLogger(__name__).critical(f"Data export failed: {e}", exc_info=True)
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
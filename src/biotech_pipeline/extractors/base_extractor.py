@@ -3,9 +3,12 @@ Base class for all extractors, providing retry and error handling.
 """
 
 import time
-from typing import Callable, Any, Dict
+from typing import Callable, Any, Dict, Optional
 from functools import wraps
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from src.biotech_pipeline.utils.exceptions import ExtractionError, NetworkError
 from src.biotech_pipeline.utils.logger import get_scraping_logger, get_error_logger
 
@@ -43,11 +46,26 @@ def retry_on_exception(
     return decorator
 
 
+def build_http_session(pool_connections: int = 20, pool_maxsize: int = 100) -> requests.Session:
+    """
+    Create a requests Session with a pooled adapter so extractors sharing it
+    reuse keep-alive connections instead of reconnecting on every request.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class BaseExtractor:
     """
     Abstract extractor implementing retry logic and standardized interface.
     """
 
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or build_http_session()
+
     @retry_on_exception(exceptions=(NetworkError,), max_retries=3, delay=1.0)
     def extract(self, *args, **kwargs) -> Dict[str, Any]:
         raise NotImplementedError("Each extractor must implement extract()")
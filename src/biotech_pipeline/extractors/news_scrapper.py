@@ -18,7 +18,8 @@ cfg = config_manager.load_config().scraping
 
 
 class NewsScraper(BaseExtractor):
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
+        super().__init__(session)
         self.api_key = api_key
         self.timeout = cfg.timeout
         self.user_agent = cfg.user_agent
@@ -28,7 +29,7 @@ class NewsScraper(BaseExtractor):
         url = "https://google.serper.dev/news"
         headers = {"X-API-KEY": self.api_key, "User-Agent": self.user_agent}
         payload = {"q": query, "num": limit}
-        resp = requests.post(url, headers=headers, json=payload, timeout=self.timeout)
+        resp = self.session.post(url, headers=headers, json=payload, timeout=self.timeout)
         if resp.status_code != 200:
             raise NetworkError("Serper API error", url, resp.status_code)
         data = resp.json().get("news", [])
@@ -43,7 +44,7 @@ class NewsScraper(BaseExtractor):
     def _fetch_rss(self, query: str, limit: int) -> List[Dict]:
         rss_url = f"https://news.google.com/rss/search?q={query}"
         headers = {"User-Agent": self.user_agent}
-        resp = requests.get(rss_url, headers=headers, timeout=self.timeout)
+        resp = self.session.get(rss_url, headers=headers, timeout=self.timeout)
         if resp.status_code != 200:
             raise NetworkError("Google RSS error", rss_url, resp.status_code)
         root = ET.fromstring(resp.content)
@@ -8,7 +8,7 @@ Sources may include:
 
 import requests
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from bs4 import BeautifulSoup
 from src.biotech_pipeline.extractors.base_extractor import BaseExtractor
 from src.biotech_pipeline.utils.exceptions import NetworkError
@@ -22,7 +22,8 @@ scrape_cfg = config_manager.load_config().scraping
 class WebExtractor(BaseExtractor):
     """Extracts public‐web data: patents, publications, funding rounds."""
 
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
+        super().__init__(session)
         self.timeout = scrape_cfg.timeout
         self.user_agent = scrape_cfg.user_agent
 
@@ -33,7 +34,7 @@ class WebExtractor(BaseExtractor):
         url = f"https://patentscope.wipo.int/search/en/result.jsf?query={company_name}"
         logger.info("Fetching patents for %s", company_name)
         try:
-            resp = requests.get(
+            resp = self.session.get(
                 url,
                 timeout=self.timeout,
                 headers={"User-Agent": self.user_agent}
@@ -78,7 +79,7 @@ class WebExtractor(BaseExtractor):
         url = f"https://api.ncbi.nlm.nih.gov/lit/ctxp/v1/pubmed/?format=json&term={company_name}"
         logger.info("Fetching publications for %s", company_name)
         try:
-            resp = requests.get(url, timeout=self.timeout,
+            resp = self.session.get(url, timeout=self.timeout,
                                 headers={"User-Agent": self.user_agent})
             resp.raise_for_status()
 
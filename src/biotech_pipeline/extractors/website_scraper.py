@@ -27,7 +27,7 @@ class WebsiteExtractor(BaseExtractor):
 
     def _fetch_page(self, url: str) -> BeautifulSoup:
         try:
-            resp = requests.get(url, timeout=scrape_cfg.timeout,
+            resp = self.session.get(url, timeout=scrape_cfg.timeout,
                                 headers={"User-Agent": scrape_cfg.user_agent})
             if resp.status_code != 200:
                 raise NetworkError("Website fetch non-200", url, resp.status_code)
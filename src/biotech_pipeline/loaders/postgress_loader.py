@@ -3,6 +3,7 @@ PostgreSQL loader with upsert support and batch operations.
 """
 
 from typing import Dict, Any, List, Optional
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from src.biotech_pipeline.core.database import SessionLocal
@@ -21,7 +22,12 @@ logger = get_database_logger()
 
 
 class PostgresLoader:
-    """Loader for batch inserting/updating all ETL entities."""
+    """
+    Loader for batch inserting/updating all ETL entities.
+
+    Append-only tables are written with a single executemany INSERT per
+    call rather than one ORM object per record.
+    """
 
     def _get_session(self) -> Session:
         return SessionLocal()
@@ -49,8 +55,8 @@ class PostgresLoader:
         session = self._get_session()
         try:
             session.query(Person).filter(Person.big_award_id == big_award_id).delete()
-            for record in people:
-                session.add(Person(**record))
+            if people:
+                session.execute(insert(Person), people)
             session.commit()
             logger.info("People loaded: %d for %s", len(people), big_award_id)
         except SQLAlchemyError as e:
@@ -65,8 +71,8 @@ class PostgresLoader:
         session = self._get_session()
         try:
             session.query(ProductService).filter(ProductService.big_award_id == big_award_id).delete()
-            for record in products:
-                session.add(ProductService(**record))
+            if products:
+                session.execute(insert(ProductService), products)
             session.commit()
             logger.info("Products/services loaded: %d for %s", len(products), big_award_id)
         except SQLAlchemyError as e:
@@ -110,8 +116,8 @@ class PostgresLoader:
     def load_funding_rounds(self, big_award_id: str, rounds: List[Dict[str, Any]]):
         session = self._get_session()
         try:
-            for record in rounds:
-                session.add(FundingRound(**record))
+            if rounds:
+                session.execute(insert(FundingRound), rounds)
             session.commit()
             logger.info("Funding rounds loaded: %d for %s", len(rounds), big_award_id)
         except SQLAlchemyError as e:
@@ -125,8 +131,8 @@ class PostgresLoader:
     def load_news_coverage(self, big_award_id: str, news: List[Dict[str, Any]]):
         session = self._get_session()
         try:
-            for record in news:
-                session.add(NewsCoverage(**record))
+            if news:
+                session.execute(insert(NewsCoverage), news)
             session.commit()
             logger.info("News coverage loaded: %d for %s", len(news), big_award_id)
         except SQLAlchemyError as e:
@@ -2,8 +2,9 @@
 Production-grade ETL orchestrator with structured versioned logging.
 """
 
-import pandas as pd
-from typing import Optional
+from contextlib import closing
+from typing import Any, Dict, Iterator, Optional, Tuple
+from openpyxl import load_workbook
 from src.biotech_pipeline.utils.config import config_manager
 from src.biotech_pipeline.utils.logger import (
     get_pipeline_logger, get_database_logger, get_scraping_logger,
@@ -12,6 +13,7 @@ from src.biotech_pipeline.utils.logger import (
 from src.biotech_pipeline.core.database import create_schema
 from src.biotech_pipeline.agents.search_agent import SearchAgent
 from src.biotech_pipeline.agents.validation_agent import validation_agent
+from src.biotech_pipeline.extractors.base_extractor import build_http_session
 from src.biotech_pipeline.extractors.web_extractor import WebExtractor
 from src.biotech_pipeline.extractors.website_scraper import WebsiteExtractor
 from src.biotech_pipeline.extractors.news_scrapper import NewsScraper
@@ -29,6 +31,55 @@ validation_logger = get_validation_logger()
 
 pipeline_config = config_manager.load_config()
 
+
+def _parse_year(value: Any) -> Optional[int]:
+    """Coerce an Excel cell value to an int year, or None if it is not numeric."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _sheet_rows(excel_path: str, max_row: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """Yield the non-empty rows of the first sheet as dicts keyed by the header row."""
+    wb = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        # The <dimension> tag is optional and often stale after edits in other
+        # tools; without this, read-only mode trusts it and may stop early
+        ws.reset_dimensions()
+        header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
+        if header is None:
+            return
+        width = len(header)
+        for values in ws.iter_rows(min_row=2, max_row=max_row, values_only=True):
+            if not any(v is not None for v in values):
+                continue
+            # Trailing empty cells may be left out of a row; pad so every header key exists
+            yield dict(zip(header, values + (None,) * (width - len(values))))
+    finally:
+        wb.close()
+
+
+def stream_company_rows(excel_path: str, max_count: Optional[int] = None) -> Tuple[int, Iterator[Dict[str, Any]]]:
+    """
+    Stream rows of the first sheet as dicts keyed by the header row.
+
+    The workbook is opened read-only so rows are parsed lazily and only up
+    to max_count rows are read. Returns the row count and the row iterator.
+    The count comes from a values-only pass over the rows rather than the
+    sheet's recorded dimensions, which may be missing or stale. The
+    iterator opens its own handle on first use and closes it when exhausted
+    or closed, so an iterator that is never consumed holds no open file.
+    """
+    max_row = max_count + 1 if max_count else None
+    with closing(_sheet_rows(excel_path, max_row)) as counted:
+        total = sum(1 for _ in counted)
+    return total, _sheet_rows(excel_path, max_row)
+
+
 class ETLOrchestrator:
     """Main orchestrator for the ETL pipeline with structured versioned logging."""
 
@@ -51,9 +102,11 @@ class ETLOrchestrator:
             context_size=self.config.ai.context_size,
             max_tokens=self.config.ai.max_tokens
         )
-        self.website_extractor = WebsiteExtractor()
-        self.web_extractor = WebExtractor()
-        self.news_scraper = NewsScraper(self.config.serper_api_key)
+        # One pooled HTTP session shared by all extractors for connection reuse
+        self.http_session = build_http_session()
+        self.website_extractor = WebsiteExtractor(session=self.http_session)
+        self.web_extractor = WebExtractor(session=self.http_session)
+        self.news_scraper = NewsScraper(self.config.serper_api_key, session=self.http_session)
         self.processor = DataProcessor()
         self.loader = PostgresLoader()
         
@@ -63,23 +116,22 @@ class ETLOrchestrator:
         pipeline_logger.info("Starting ETL run: %s mode | Version: %s", mode, self.run_version)
         
         try:
-            df = pd.read_excel(excel_path)
-            if mode == "pilot":
-                df = df.head(self.config.batch_size)
+            max_count = self.config.batch_size if mode == "pilot" else None
+            total, rows = stream_company_rows(excel_path, max_count)
             
-            pipeline_logger.info("Pipeline run initialized with %d companies to process", len(df))
+            pipeline_logger.info("Pipeline run initialized with %d companies to process", total)
 
             # Track statistics
             successful_companies = 0
             failed_companies = 0
             validation_failures = 0
 
-            for idx, row in df.iterrows():
+            for idx, row in enumerate(rows, 1):
                 bid = row["Reference Number"]
                 name = row["Name Of The Company"]
-                year = int(row["Grant Year"])
+                year = _parse_year(row.get("Grant Year"))
                 
-                pipeline_logger.log_pipeline_progress(idx+1, len(df), name, "Processing")
+                pipeline_logger.log_pipeline_progress(idx, total, name, "Processing")
 
                 try:
                     # AI Profile Extraction
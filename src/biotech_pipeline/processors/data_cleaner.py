@@ -3,19 +3,18 @@ Data Cleaning and Transformation Utilities
 """
 
 import re
+import string
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from src.biotech_pipeline.utils.logger import get_scraping_logger
-from src.biotech_pipeline.utils.config import config_manager
+
 logger = get_scraping_logger()
-cfg = config_manager.load_config().scraping
 
 def clean_company_name(name: str) -> str:
     """Title-case and normalize whitespace."""
     if not name:
         return ""
-    cleaned = " ".join(name.strip().split())
-    return " ".join(word.capitalize() for word in cleaned.split())
+    return string.capwords(name)
 
 
 def clean_url(url) -> str:
@@ -60,7 +59,7 @@ def parse_date(date_str: str) -> Optional[datetime.date]:
     for fmt in ("%b %d, %Y", "%B %d, %Y", "%Y-%m-%d"):
         try:
             return datetime.strptime(date_str.strip(), fmt).date()
-        except:
+        except (ValueError, AttributeError):
             continue
     return None
 
@@ -25,7 +25,12 @@ class DataProcessor:
         final = {}
         for fld in fields:
             vals = [src.get(fld) for src in sources if src.get(fld)]
-            final[fld] = Counter(vals).most_common(1)[0] if vals else None
+            if not vals:
+                final[fld] = None
+            elif len(vals) == 1:
+                final[fld] = vals[0]
+            else:
+                final[fld] = Counter(vals).most_common(1)[0][0]
 
         # Consolidate founders lists
         all_founders = sum((src.get("founders", []) for src in sources), [])
@@ -68,27 +73,31 @@ class DataProcessor:
             )
         }
 
+        birac_url = birac_data.get("source_url")
+        website_url = website_data.get("source_url")
+        today = date.today()
+
         # People
-        people = []
-        for f in consolidated["founders"]:
-            people.append({
-                "big_award_id": big_award_id,
-                "full_name": f["full_name"],
-                "designation": f.get("designation"),
-                "role_type": f.get("role_type", "Founder"),
-                "source": "AI Agent",
-                "source_url": None
-            })
-        for role, members in [("Core Team", birac_data.get("team", [])), ("Advisor", birac_data.get("advisors", []))]:
-            for name in members:
-                people.append({
-                    "big_award_id": big_award_id,
-                    "full_name": clean_company_name(name),
-                    "designation": None,
-                    "role_type": role,
-                    "source": "BIRAC",
-                    "source_url": birac_data.get("source_url")
-                })
+        people = [
+            {"big_award_id": big_award_id,
+             "full_name": f["full_name"],
+             "designation": f.get("designation"),
+             "role_type": f.get("role_type", "Founder"),
+             "source": "AI Agent",
+             "source_url": None}
+            for f in consolidated["founders"]
+        ]
+        people += [
+            {"big_award_id": big_award_id,
+             "full_name": clean_company_name(name),
+             "designation": None,
+             "role_type": role,
+             "source": "BIRAC",
+             "source_url": birac_url}
+            for role, members in (("Core Team", birac_data.get("team", [])),
+                                  ("Advisor", birac_data.get("advisors", [])))
+            for name in members
+        ]
 
         # Products
         products = [
@@ -96,7 +105,7 @@ class DataProcessor:
              "product_name": p,
              "development_stage": None,
              "source": "Website",
-             "source_url": website_data.get("source_url")}
+             "source_url": website_url}
             for p in website_data.get("products", [])
         ]
 
@@ -112,7 +121,7 @@ class DataProcessor:
              "foreign_jurisdiction": False,
              "jurisdiction_list": None,
              "source": "Website",
-             "source_url": website_data.get("source_url")}
+             "source_url": website_url}
             for p in website_data.get("patents", [])
         ]
 
@@ -125,7 +134,7 @@ class DataProcessor:
              "publication_year": None,
              "citation_text": None,
              "source": "Website",
-             "source_url": website_data.get("source_url")}
+             "source_url": website_url}
             for t in website_data.get("publications", [])
         ]
 
@@ -148,16 +157,15 @@ class DataProcessor:
                 logger.warning(f"Skipping invalid funding entry: {e}")
 
         # News
-        news = []
-        for n in news_items:
-            news.append({
-                "big_award_id": big_award_id,
-                "headline": n.get("headline"),
-                "published_date": parse_date(n.get("published_date")),
-                "news_category": n.get("news_category"),
-                "article_url": n.get("article_url"),
-                "scraped_at": date.today()
-            })
+        news = [
+            {"big_award_id": big_award_id,
+             "headline": n.get("headline"),
+             "published_date": parse_date(n.get("published_date")),
+             "news_category": n.get("news_category"),
+             "article_url": n.get("article_url"),
+             "scraped_at": today}
+            for n in news_items
+        ]
 
         return {
             "company": [comp],
@@ -43,14 +43,22 @@
 Configuration management with environment variable support and validation.
 """
 
+import copy
 import os
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
+from functools import lru_cache
 
 from src.biotech_pipeline.utils.exceptions import ConfigurationError
 
+# Prefer the libyaml-backed C loader; fall back when PyYAML lacks libyaml
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 @dataclass
 class DatabaseConfig:
@@ -99,31 +107,61 @@ class PipelineConfig:
     export: Optional[ExportConfig] = None
 
 
+# (environment variable, config key path, type conversion) for env overrides
+_ENV_SETTERS = (
+    ('DB_HOST', ('database', 'host'), str),
+    ('DB_PORT', ('database', 'port'), int),
+    ('DB_NAME', ('database', 'database'), str),
+    ('DB_USER', ('database', 'username'), str),
+    ('DB_PASSWORD', ('database', 'password'), str),
+    ('AI_MODEL_PATH', ('ai', 'model_path'), str),
+    ('SERPER_API_KEY', ('serper_api_key',), str),
+    ('LOG_LEVEL', ('log_level',), str),
+)
+
+
+@lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime: float) -> Any:
+    """Parse a YAML file once per (path, mtime); editing the file invalidates the entry."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def load_yaml(path: str) -> Any:
+    """Return a private copy of a parsed YAML file, parsing it only when it changed."""
+    resolved = Path(path).resolve()
+    return copy.deepcopy(_read_yaml(str(resolved), resolved.stat().st_mtime))
+
+
 class ConfigManager:
     """Configuration manager with environment variable support."""
     
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or "config/pipeline_config.yaml"
         self._config = None
+        self._config_key = None
     
     def load_config(self) -> PipelineConfig:
         """Load configuration from file and environment variables."""
-        if self._config is not None:
-            return self._config
-        
         try:
             config_file = Path(self.config_path)
             if not config_file.exists():
                 raise ConfigurationError(f"Configuration file not found: {self.config_path}")
+
+            # Reuse the built config until the path changes or the file is edited
+            key = (str(config_file.resolve()), config_file.stat().st_mtime)
+            if self._config is not None and self._config_key == key:
+                return self._config
             
-            with open(config_file, 'r') as f:
-                raw_config = yaml.safe_load(f)
+            # Copy so env overrides never leak into the cached parse
+            raw_config = copy.deepcopy(_read_yaml(*key))
             
             # Override with environment variables
             self._apply_env_overrides(raw_config)
             
             # Validate and create configuration
             self._config = self._create_config(raw_config)
+            self._config_key = key
             return self._config
             
         except yaml.YAMLError as e:
@@ -133,38 +171,13 @@ class ConfigManager:
     
     def _apply_env_overrides(self, config: Dict[str, Any]) -> None:
         """Apply environment variable overrides."""
-        env_mappings = {
-            'DB_HOST': 'database.host',
-            'DB_PORT': 'database.port',
-            'DB_NAME': 'database.database',
-            'DB_USER': 'database.username',
-            'DB_PASSWORD': 'database.password',
-            'AI_MODEL_PATH': 'ai.model_path',
-            'SERPER_API_KEY': 'serper_api_key',
-            'LOG_LEVEL': 'log_level'
-        }
-        
-        for env_var, config_path in env_mappings.items():
+        for env_var, keys, cast in _ENV_SETTERS:
             value = os.getenv(env_var)
             if value:
-                self._set_nested_value(config, config_path, value)
-    
-    def _set_nested_value(self, config: Dict, path: str, value: str) -> None:
-        """Set nested configuration value from dot notation path."""
-        keys = path.split('.')
-        current = config
-        for key in keys[:-1]:
-            current = current.setdefault(key, {})
-        
-        # Type conversion
-        if keys[-1] == 'port':
-            value = int(value)
-        elif keys[-1] in ['pool_size', 'max_overflow', 'batch_size']:
-            value = int(value)
-        elif keys[-1] in ['enable_validation']:
-            value = value.lower() == 'true'
-            
-        current[keys[-1]] = value
+                current = config
+                for key in keys[:-1]:
+                    current = current.setdefault(key, {})
+                current[keys[-1]] = cast(value)
     
     def _create_config(self, raw_config: Dict[str, Any]) -> PipelineConfig:
         try:
@@ -31,6 +31,9 @@ from typing import Optional, Any, Dict
 
 class ETLPipelineError(Exception):
     """Base exception for ETL pipeline errors."""
+    # Slots across the hierarchy: errors are raised per failing row, and slot
+    # assignment is cheaper than filling the instance __dict__
+    __slots__ = ("message", "details")
     
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message)
@@ -40,11 +43,12 @@ class ETLPipelineError(Exception):
 
 class ConfigurationError(ETLPipelineError):
     """Configuration-related errors."""
-    pass
+    __slots__ = ()
 
 
 class ExtractionError(ETLPipelineError):
     """Data extraction errors."""
+    __slots__ = ("source",)
     
     def __init__(self, message: str, source: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message, details)
@@ -53,11 +57,12 @@ class ExtractionError(ETLPipelineError):
 
 class TransformationError(ETLPipelineError):
     """Data transformation errors."""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(ETLPipelineError):
     """Data validation errors."""
+    __slots__ = ("field", "value")
     
     def __init__(self, message: str, field: str, value: Any, details: Optional[Dict[str, Any]] = None):
         super().__init__(message, details)
@@ -67,6 +72,7 @@ class ValidationError(ETLPipelineError):
 
 class LoadingError(ETLPipelineError):
     """Data loading errors."""
+    __slots__ = ("table",)
     
     def __init__(self, message: str, table: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message, details)
@@ -75,16 +81,17 @@ class LoadingError(ETLPipelineError):
 
 class DatabaseError(ETLPipelineError):
     """Database connection and operation errors."""
-    pass
+    __slots__ = ()
 
 
 class AIModelError(ETLPipelineError):
     """AI model-related errors."""
-    pass
+    __slots__ = ()
 
 
 class NetworkError(ETLPipelineError):
     """Network and API-related errors."""
+    __slots__ = ("url", "status_code")
     
     def __init__(self, message: str, url: str, status_code: Optional[int] = None, 
                  details: Optional[Dict[str, Any]] = None):
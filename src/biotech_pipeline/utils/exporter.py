@@ -1,14 +1,48 @@
 # src/biotech_pipeline/utils/exporter.py
 
+import os
+import queue
+import threading
+from contextlib import closing
+from concurrent.futures import Future, ThreadPoolExecutor
 import pandas as pd
+from openpyxl import Workbook
+from sqlalchemy import Integer, TIMESTAMP, inspect
 from sqlalchemy.orm import Session
 from src.biotech_pipeline.core.database import SessionLocal
+from src.biotech_pipeline.core.model import Base
 from src.biotech_pipeline.utils.logger import get_database_logger
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterator, List
 
 logger = get_database_logger()
 
-from typing import List
+# Opt-in (EXPORT_USE_CONNECTORX=1, with the "connectorx" extra installed):
+# connectorx reads query results into Arrow in native code; its record
+# batches are only usable with pyarrow, so both must be present
+cx = None
+if os.getenv("EXPORT_USE_CONNECTORX", "").lower() in ("1", "true", "yes"):
+    try:
+        import connectorx as cx
+        import pyarrow  # noqa: F401
+    except ImportError:
+        cx = None
+        logger.warning("EXPORT_USE_CONNECTORX is set but connectorx/pyarrow are not installed; "
+                       "exporting through SQLAlchemy")
+
+# Rows fetched per round trip when streaming a table into the workbook
+EXPORT_CHUNK_SIZE = 50_000
+# Parallel range queries connectorx issues for a table with an integer key. Each
+# is its own connection to the engine's database, outside the SQLAlchemy pool
+EXPORT_PARTITIONS = 4
+# Tables fetched concurrently, each on its own connection(s)
+EXPORT_WORKERS = 4
+# Chunks a fetcher may hold ahead of the workbook writer
+EXPORT_PREFETCH_CHUNKS = 2
+# Seconds the writer waits for a table's next chunk before failing the export
+EXPORT_STALL_TIMEOUT = 900
+
+# Queue marker a fetcher puts after the last chunk of its table
+_END_OF_TABLE = object()
 
 def make_datetimes_timezone_naive(df: pd.DataFrame) -> pd.DataFrame:
     for col in df.select_dtypes(include=['datetimetz']).columns:
@@ -16,41 +50,233 @@ def make_datetimes_timezone_naive(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _table_select(conn, table_name: str) -> str:
+    """
+    SELECT for a whole table with timestamptz columns as naive UTC timestamps.
+
+    read_sql normalises tz-aware values to UTC before make_datetimes_timezone_naive
+    drops the zone, so AT TIME ZONE 'UTC' yields the same values regardless of
+    the server's session time zone, without pandas building tz-aware columns.
+    """
+    quote = conn.dialect.identifier_preparer.quote
+    columns = []
+    for column in inspect(conn).get_columns(table_name):
+        name = quote(column["name"])
+        if isinstance(column["type"], TIMESTAMP) and column["type"].timezone:
+            columns.append(f"({name} AT TIME ZONE 'UTC') AS {name}")
+        else:
+            columns.append(name)
+    return f"SELECT {', '.join(columns)} FROM {quote(table_name)}"
+
+
+def _partition_column(table_name: str) -> Optional[str]:
+    """Single integer primary key of a mapped table, usable for partitioned reads."""
+    table = Base.metadata.tables.get(table_name)
+    if table is None:
+        return None
+    keys = list(table.primary_key.columns)
+    if len(keys) == 1 and isinstance(keys[0].type, Integer):
+        return keys[0].name
+    return None
+
+
+def _export_sql(conn, table_name: str) -> str:
+    """Query for one export entry: a table name or a raw SQL statement."""
+    sql = _table_select(conn, table_name) if table_name.isidentifier() else table_name
+    logger.info("Exporting sheet '%s' with SQL: %s", table_name, sql)
+    return sql
+
+
+def _read_chunks(engine, table_name: str) -> Iterator[pd.DataFrame]:
+    """
+    Yield the rows of one export entry as DataFrames of at most EXPORT_CHUNK_SIZE rows.
+
+    Both paths stream: pandas through a server-side cursor on a pooled
+    connection, connectorx as Arrow record batches. connectorx may decode a
+    batch or so ahead per partition, so a table in flight holds up to about
+    EXPORT_PARTITIONS + EXPORT_PREFETCH_CHUNKS chunks rather than just the
+    queued ones.
+    """
+    if cx is None:
+        with engine.connect() as conn:
+            # Server-side cursor: only one chunk of rows is held client-side at a time
+            conn = conn.execution_options(stream_results=True)
+            yield from pd.read_sql(_export_sql(conn, table_name), conn, chunksize=EXPORT_CHUNK_SIZE)
+        return
+
+    # connectorx opens its own connections to the engine's database. The pooled
+    # connection is only needed to inspect the columns and is returned before
+    # the read starts; opening it first also fails fast on an unreachable server,
+    # where connectorx's own pool would keep retrying
+    with engine.connect() as conn:
+        sql = _export_sql(conn, table_name)
+    # connectorx takes a plain postgresql:// URL, without the SQLAlchemy driver suffix
+    url = engine.url.set(drivername=engine.url.get_backend_name()).render_as_string(hide_password=False)
+    partition_on = _partition_column(table_name)
+    if partition_on:
+        reader = cx.read_sql(url, sql, return_type="arrow_stream", batch_size=EXPORT_CHUNK_SIZE,
+                             partition_on=partition_on, partition_num=EXPORT_PARTITIONS)
+    else:
+        reader = cx.read_sql(url, sql, return_type="arrow_stream", batch_size=EXPORT_CHUNK_SIZE)
+    for batch in reader:
+        yield batch.to_pandas(split_blocks=True)
+
+
+def _put(chunks: queue.Queue, item, cancelled: threading.Event) -> bool:
+    """Block until `item` is queued; give up (False) once the export is cancelled."""
+    while not cancelled.is_set():
+        try:
+            chunks.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _fetch_table(engine, table_name: str, chunks: queue.Queue, cancelled: threading.Event) -> None:
+    """Stream one table into `chunks` for the workbook writer."""
+    if cancelled.is_set():
+        return
+    try:
+        # closing() releases the reader's connection if the export is cancelled mid-table
+        with closing(_read_chunks(engine, table_name)) as table_chunks:
+            for chunk in table_chunks:
+                if chunk.empty:
+                    continue
+                # Raw SQL entries can still return timezone-aware columns
+                if not _put(chunks, make_datetimes_timezone_naive(chunk), cancelled):
+                    return
+    except Exception as e:
+        # Handed to the writer, which re-raises it in the calling thread
+        _put(chunks, e, cancelled)
+        return
+    _put(chunks, _END_OF_TABLE, cancelled)
+
+
+def _next_chunk(table_name: str, chunks: queue.Queue, fetcher: Future):
+    """
+    Wait for the next item a fetcher queued for `table_name`.
+
+    Polls rather than blocking outright, so a fetcher that died without
+    queuing its end marker (or an exception) fails the export instead of
+    hanging it; so does one that stalls for EXPORT_STALL_TIMEOUT.
+    """
+    waited = 0.0
+    while True:
+        try:
+            return chunks.get(timeout=0.5)
+        except queue.Empty:
+            pass
+        if fetcher.done():
+            # The fetcher may have queued its last item just before finishing
+            try:
+                return chunks.get_nowait()
+            except queue.Empty:
+                pass
+            error = fetcher.exception()
+            if error is not None:
+                raise error
+            raise RuntimeError(f"Export of '{table_name}' stopped without finishing the table")
+        waited += 0.5
+        if waited >= EXPORT_STALL_TIMEOUT:
+            raise TimeoutError(f"No data for '{table_name}' in {EXPORT_STALL_TIMEOUT}s; export stalled")
+
+
 def export_tables_to_excel(
     excel_path: str,
     table_names: List[str]
 ) -> None:
+    session: Session = SessionLocal()
+    cancelled = threading.Event()
+    try:
+        # Write-only workbook streams rows to disk instead of keeping every cell in memory
+        workbook = Workbook(write_only=True)
+        # Tables are fetched in parallel, but openpyxl is not thread-safe, so sheets
+        # are written here one at a time in the configured order
+        table_chunks = [queue.Queue(maxsize=EXPORT_PREFETCH_CHUNKS) for _ in table_names]
+        pool = ThreadPoolExecutor(max_workers=max(1, min(EXPORT_WORKERS, len(table_names))))
+        finished = False
+        try:
+            fetchers = [
+                pool.submit(_fetch_table, session.bind, table_name, chunks, cancelled)
+                for table_name, chunks in zip(table_names, table_chunks)
+            ]
+
+            sheet_written = False
+            for table_name, chunks, fetcher in zip(table_names, table_chunks, fetchers):
+                sheet = None
+                while (chunk := _next_chunk(table_name, chunks, fetcher)) is not _END_OF_TABLE:
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    if sheet is None:
+                        sheet = workbook.create_sheet(title=table_name)
+                        sheet.append(list(chunk.columns))
+                    # Missing values become empty cells, as with DataFrame.to_excel
+                    for row in chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None):
+                        sheet.append(row)
+
+                if sheet is None:
+                    logger.warning("No data for table '%s', skipping sheet", table_name)
+                    continue
+                sheet_written = True
+            finished = True
+        finally:
+            # Unblocks fetchers still waiting on a full queue if the writer stopped early
+            cancelled.set()
+            # After a failure, don't wait on a fetcher that may be stuck in a read
+            pool.shutdown(wait=finished, cancel_futures=True)
+
+        if not sheet_written:
+            raise ValueError("No data to export: Excel must have at least one visible sheet.")
+
+        workbook.save(excel_path)
+        logger.info("Exported Excel file successfully: %s", excel_path)
+
+    except Exception:
+        logger.error("Failed to export Excel file %s", excel_path, exc_info=True)
+        raise
+    finally:
+        session.close()
+
+
+def export_tables_to_csv(
+    output_dir: str,
+    table_names: List[str]
+) -> List[str]:
+    """
+    Export each table to <output_dir>/<name>.csv with Postgres COPY ... TO STDOUT.
+
+    The server streams CSV straight into the file, so no DataFrame or per-cell
+    Python objects are built; use this for tables too large for the Excel export.
+    Entries that are not plain table names are run as queries and written to
+    query_<n>.csv. Returns the paths written.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
     session: Session = SessionLocal()
     try:
         with session.bind.connect() as conn:
-            with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
-                sheet_written = False
-                for table_name in table_names:
+            # COPY is only reachable through the raw psycopg2 cursor
+            with conn.connection.cursor() as cursor:
+                for index, table_name in enumerate(table_names, 1):
                     if table_name.isidentifier():
                         sql = f"SELECT * FROM {table_name}"
+                        file_name = f"{table_name}.csv"
                     else:
                         sql = table_name
+                        file_name = f"query_{index}.csv"
 
-                    logger.info("Exporting sheet '%s' with SQL: %s", table_name, sql)
-                    df = pd.read_sql(sql, conn)
+                    csv_path = os.path.join(output_dir, file_name)
+                    logger.info("Exporting '%s' to %s with SQL: %s", table_name, csv_path, sql)
+                    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+                        cursor.copy_expert(f"COPY ({sql}) TO STDOUT WITH CSV HEADER", f)
+                    written.append(csv_path)
 
-                    # Convert timezone-aware datetime columns to naive (remove tz)
-                    df = make_datetimes_timezone_naive(df)
-                    
-                    if df.empty:
-                        logger.warning("No data for table '%s', skipping sheet", table_name)
-                        continue
-
-                    df.to_excel(writer, sheet_name=table_name, index=False)
-                    sheet_written = True
-
-                if not sheet_written:
-                    raise ValueError("No data to export: Excel must have at least one visible sheet.")
-
-        logger.info("Exported Excel file successfully: %s", excel_path)
+        logger.info("Exported %d CSV file(s) to %s", len(written), output_dir)
+        return written
 
     except Exception:
-        logger.error("Failed to export Excel file %s", excel_path, exc_info=True)
+        logger.error("Failed to export CSV files to %s", output_dir, exc_info=True)
         raise
     finally:
         session.close()
@@ -2,12 +2,18 @@
 Common helper functions used throughout the pipeline.
 """
 
+import asyncio
+import random
 import re
-from datetime import datetime
-from urllib.parse import urlparse
+from datetime import date, datetime
 import time
 from functools import wraps
 
+from src.biotech_pipeline.utils.exceptions import DatabaseError, NetworkError
+
+# Failures worth retrying by default; anything else is raised immediately
+TRANSIENT_ERRORS = (NetworkError, DatabaseError, TimeoutError, ConnectionError)
+
 def clean_text(text: str, max_length: int = None) -> str:
     """
     Normalize whitespace and remove non-printable chars.
@@ -17,48 +23,131 @@ def clean_text(text: str, max_length: int = None) -> str:
         return ""
     cleaned = " ".join(text.split())
     if max_length and len(cleaned) > max_length:
-        cleaned = cleaned[:max_length].rsplit(" ",1)[0] + "..."
+        # Cut at the last space inside the limit without building a split list
+        cut = cleaned.rfind(" ", 0, max_length)
+        cleaned = (cleaned[:cut] if cut > 0 else cleaned[:max_length]) + "..."
     return cleaned
 
+# http(s) scheme followed by a non-empty host, i.e. what urlparse reports as netloc
+_HTTP_URL_RE = re.compile(r"https?://[^/?#]", re.IGNORECASE)
+
 def is_valid_url(url: str) -> bool:
     """
     Simple URL validation.
     """
-    try:
-        p = urlparse(url)
-        return p.scheme in ("http","https") and bool(p.netloc)
-    except:
-        return False
+    return isinstance(url, str) and _HTTP_URL_RE.match(url) is not None
 
 def parse_date(date_str: str, fmt: str = "%Y-%m-%d") -> datetime.date:
     """
     Parse a date string into a date object.
     """
     try:
+        # date.fromisoformat is a C fast path for zero-padded ISO dates;
+        # strptime re-interprets the format string on every call
+        if fmt == "%Y-%m-%d" and len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+            try:
+                return date.fromisoformat(date_str)
+            except ValueError:
+                pass
         return datetime.strptime(date_str, fmt).date()
-    except:
+    except (ValueError, TypeError):
         return None
 
 
 import json
 
+# orjson parses several times faster; stdlib json stays for the recovery path
+# (raw_decode has no orjson equivalent). orjson's decode error subclasses json's.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_JSON_DECODER = json.JSONDecoder()
+# Body of a markdown code fence; an unterminated fence runs to the end of the text
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL | re.IGNORECASE)
+
+
+def _close_truncated_json(text: str) -> str:
+    """Close the string and brackets left open by JSON that was cut off."""
+    closers = []
+    in_string = escaped = False
+    escape_at = pending_hex = 0
+    for i, ch in enumerate(text):
+        if in_string:
+            if pending_hex:
+                pending_hex -= 1
+            elif escaped:
+                escaped = False
+                if ch == "u":
+                    pending_hex = 4
+            elif ch == "\\":
+                escaped = True
+                escape_at = i
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            closers.append("}")
+        elif ch == "[":
+            closers.append("]")
+        elif ch in "}]" and closers:
+            closers.pop()
+    if in_string:
+        if escaped or pending_hex:
+            # Cut off inside an escape sequence; drop the partial escape
+            text = text[:escape_at]
+        text += '"'
+    return text.rstrip().rstrip(",") + "".join(reversed(closers))
+
+
 def safe_json_load(text):
+    """
+    Parse JSON from model output, recovering from common formatting damage.
+
+    Tries the text as-is, then a leading JSON value followed by other text,
+    the body of a ```json fence, the first object in surrounding prose, and
+    finally that object with unclosed strings/brackets closed.
+    """
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except json.JSONDecodeError:
-        # Possibly log warning about malformed JSON
-        # Optionally use partial decode or fallback default:
+        pass
+    try:
+        return _JSON_DECODER.raw_decode(text)[0]
+    except json.JSONDecodeError:
+        pass
+
+    fence = _JSON_FENCE_RE.search(text)
+    if fence:
+        text = fence.group(1)
+    start = text.find("{")
+    if start != -1:
+        candidate = text[start:]
         try:
-            decoder = json.JSONDecoder()
-            obj, idx = decoder.raw_decode(text)
-            return obj
-        except Exception:
-            return {"website": "", "founders": []}
-        
-
-def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
+            return _JSON_DECODER.raw_decode(candidate)[0]
+        except json.JSONDecodeError:
+            pass
+        try:
+            return json.loads(_close_truncated_json(candidate))
+        except json.JSONDecodeError:
+            pass
+    return {"website": "", "founders": []}
+
+
+def _backoff_delay(base_delay: float, attempt: int) -> float:
+    """Exponential delay for an attempt, plus up to 10% jitter so retries don't align."""
+    delay = base_delay * (2 ** attempt)
+    return delay + random.uniform(0, delay * 0.1)
+
+
+def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0,
+                       retry_on: tuple = TRANSIENT_ERRORS):
     """
     Decorator for retry logic with exponential backoff.
+    Only exceptions in `retry_on` are retried.
     """
     def decorator(func):
         @wraps(func)
@@ -68,15 +157,41 @@ def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except retry_on as e:
+                    last_exception = e
+                    if attempt == max_retries:
+                        break
+                    
+                    time.sleep(_backoff_delay(base_delay, attempt))
+            
+            # Re-raise the last exception if all retries failed
+            raise last_exception
+        return wrapper
+    return decorator
+
+
+def retry_with_backoff_async(max_retries: int = 3, base_delay: float = 1.0,
+                             retry_on: tuple = TRANSIENT_ERRORS):
+    """
+    Async counterpart of retry_with_backoff.
+    Waits with asyncio.sleep, so other tasks keep running between attempts.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            last_exception = None
+            
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except retry_on as e:
                     last_exception = e
                     if attempt == max_retries:
                         break
                     
-                    delay = base_delay * (2 ** attempt)
-                    time.sleep(delay)
+                    await asyncio.sleep(_backoff_delay(base_delay, attempt))
             
             # Re-raise the last exception if all retries failed
             raise last_exception
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
@@ -1,78 +1,3 @@
-# """
-# Logger helper for the ETL pipeline.
-
-# This module assumes that logging is fully configured from an external
-# logging configuration file (e.g., config/logging.yaml) loaded at application startup.
-
-# Enhancements:
-# - Adds `log_validation()` for validation-specific structured logging.
-# - Keeps `log_execution_time` decorator for performance measurement.
-# """
-
-
-# import logging
-# import time
-# from functools import wraps
-# from typing import Optional, List, Dict, Any
-
-
-# class ETLLoggerAdapter(logging.LoggerAdapter):
-#     """Logger adapter that adds ETL-specific convenience methods."""
-
-#     ### CHANGE: Ensure kwargs are preserved in all messages
-#     def process(self, msg, kwargs):
-#         return msg, kwargs
-
-#     def log_validation(
-#         self,
-#         entity: str,
-#         passed: bool,
-#         errors: Optional[List[str]] = None,
-#         warnings: Optional[List[str]] = None,
-#         quality_scores: Optional[Dict[str, Any]] = None,
-#     ):
-#         """Log validation results in a unified format."""
-#         status = "PASSED" if passed else "FAILED"
-#         self.info(
-#             f"Validation for {entity}: {status} | "
-#             f"errors={len(errors or [])}, warnings={len(warnings or [])}, "
-#             f"quality_scores={quality_scores}"
-#         )
-
-
-# def get_logger(name: str) -> ETLLoggerAdapter:
-#     """Always return ETLLoggerAdapter so .log_validation exists."""
-#     base_logger = logging.getLogger(name)
-#     if not isinstance(base_logger, ETLLoggerAdapter):
-#         return ETLLoggerAdapter(base_logger, {})
-#     return base_logger
-
-
-# def log_execution_time(logger_instance: Optional[logging.Logger] = None):
-#     """Decorator to log function execution time."""
-#     def decorator(func):
-#         @wraps(func)
-#         def wrapper(*args, **kwargs):
-#             func_logger = logger_instance or get_logger(func.__module__)
-#             start_time = time.time()
-#             try:
-#                 result = func(*args, **kwargs)
-#                 func_logger.info(
-#                     f"Operation completed: {func.__module__}.{func.__name__} "
-#                     f"(duration: {time.time() - start_time:.3f}s)"
-#                 )
-#                 return result
-#             except Exception as e:
-#                 func_logger.error(
-#                     f"Operation failed: {func.__module__}.{func.__name__} "
-#                     f"(duration: {time.time() - start_time:.3f}s) - Error: {e}",
-#                     exc_info=True
-#                 )
-#                 raise
-#         return wrapper
-#     return decorator
-
-
 """
 Enhanced versioned logger helper for structured ETL pipeline logging.
 
@@ -81,16 +6,21 @@ category-based log separation, and run-based versioning. Works with external
 logging configuration and adds ETL-specific functionality.
 """
 
+import atexit
+import copy
 import logging
 import logging.config
+import queue
 import time
 import os
-import yaml
-from functools import wraps
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from functools import cache, lru_cache, wraps
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 from datetime import datetime
 
+from src.biotech_pipeline.utils.config import load_yaml
+
 # =========================================================
 # 🔹 Global Run Version Generation
 # =========================================================
@@ -99,33 +29,69 @@ def generate_run_version() -> str:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     return f"RUN_{timestamp}"
 
-# Generate run version once per pipeline execution
-CURRENT_RUN_VERSION = generate_run_version()
+@cache
+def get_run_version() -> str:
+    """Get current run version, generated on first request and fixed for the process."""
+    return generate_run_version()
 
-class VersionedFormatter(logging.Formatter):
-    """Custom formatter that injects version into log records."""
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.version = CURRENT_RUN_VERSION
-    
-    def format(self, record):
-        # Inject version into record
-        record.version = self.version
-        return super().format(record)
+# Set once configure_versioned_logging has applied a configuration
+_CONFIGURED = False
 
 class VersionFilter(logging.Filter):
     """Inject run version into all log records."""
+    def __init__(self, name=''):
+        super().__init__(name)
+        self.version = get_run_version()
+
     def filter(self, record):
-        record.version = CURRENT_RUN_VERSION
+        record.version = self.version
         return True
 
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that lets the file buffer batch its writes.
+
+    The stock handler stats the file, formats twice and seeks (which flushes)
+    on every record to decide on rollover. This one tracks the file size itself
+    and flushes only for records at flush_level or above; rollover and close
+    flush as usual.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None,
+                 delay=False, errors=None, flush_level=logging.ERROR):
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, errors)
+        self.flush_level = flush_level
+        self._size = None
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self._size is None:
+                self._size = os.path.getsize(self.baseFilename)
+            # maxBytes is in bytes; non-ASCII text encodes to more than one byte per character
+            size = len(msg) if msg.isascii() else len(msg.encode(self.stream.encoding, self.stream.errors))
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+                self._size = 0
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 class ETLLoggerAdapter(logging.LoggerAdapter):
     """Logger adapter that adds ETL-specific convenience methods."""
 
     def __init__(self, logger, extra=None):
         super().__init__(logger, extra or {})
-        self.run_version = CURRENT_RUN_VERSION
+        self.run_version = get_run_version()
 
     def process(self, msg, kwargs):
         # Version is now handled by formatter, no need to inject in message
@@ -142,9 +108,8 @@ class ETLLoggerAdapter(logging.LoggerAdapter):
         """Log validation results in a unified format."""
         status = "PASSED" if passed else "FAILED"
         self.info(
-            f"Validation for {entity}: {status} | "
-            f"errors={len(errors or [])}, warnings={len(warnings or [])}, "
-            f"quality_scores={quality_scores}"
+            "Validation for %s: %s | errors=%d, warnings=%d, quality_scores=%s",
+            entity, status, len(errors or []), len(warnings or []), quality_scores
         )
 
     def log_extraction(
@@ -157,9 +122,9 @@ class ETLLoggerAdapter(logging.LoggerAdapter):
     ):
         """Log extraction results in a unified format."""
         if status.lower() == "success":
-            self.info(f"Extraction successful for {company} | type={data_type}, records={records_found}")
+            self.info("Extraction successful for %s | type=%s, records=%s", company, data_type, records_found)
         else:
-            self.error(f"Extraction failed for {company} | type={data_type}, error={error_message}")
+            self.error("Extraction failed for %s | type=%s, error=%s", company, data_type, error_message)
 
     def log_database_operation(
         self,
@@ -171,9 +136,9 @@ class ETLLoggerAdapter(logging.LoggerAdapter):
     ):
         """Log database operations in a unified format."""
         if status.lower() == "success":
-            self.info(f"DB {operation} successful | table={table}, records={records}")
+            self.info("DB %s successful | table=%s, records=%s", operation, table, records)
         else:
-            self.error(f"DB {operation} failed | table={table}, error={error}")
+            self.error("DB %s failed | table=%s, error=%s", operation, table, error)
 
     def log_pipeline_progress(
         self,
@@ -184,78 +149,167 @@ class ETLLoggerAdapter(logging.LoggerAdapter):
     ):
         """Log pipeline progress in a unified format."""
         percentage = (current / total) * 100 if total > 0 else 0
-        self.info(f"{operation} progress: {current}/{total} ({percentage:.1f}%) | Current: {company_name}")
-
-def ensure_log_directories():
-    """Ensure all log directories exist with versioned structure."""
-    log_dirs = [
-        "logs/pipeline",
-        "logs/database", 
-        "logs/scraping",
-        "logs/validation",
-        "logs/errors/validation_errors",
-        "logs/errors/database_errors",
-        "logs/errors/extraction_errors",
-        "logs/errors/pipeline_errors",
-        "logs/errors/critical_errors"
-    ]
-    
+        self.info("%s progress: %s/%s (%.1f%%) | Current: %s", operation, current, total, percentage, company_name)
+
+DEFAULT_LOG_DIRS = (
+    "logs/pipeline",
+    "logs/database", 
+    "logs/scraping",
+    "logs/validation",
+    "logs/errors/validation_errors",
+    "logs/errors/database_errors",
+    "logs/errors/extraction_errors",
+    "logs/errors/pipeline_errors",
+    "logs/errors/critical_errors"
+)
+
+def ensure_log_directories(log_dirs=DEFAULT_LOG_DIRS):
+    """Ensure the given log directories (by default the versioned structure) exist."""
     for log_dir in log_dirs:
         Path(log_dir).mkdir(parents=True, exist_ok=True)
 
+class _RoutingQueueHandler(QueueHandler):
+    """Queue handler that tags each record with the handlers of the logger it replaced."""
+
+    def __init__(self, log_queue, targets):
+        super().__init__(log_queue)
+        self.targets = targets
+
+    def prepare(self, record):
+        # Merge args now, since callers may mutate them after the call returns,
+        # but keep exc_info: the listener's formatters render the traceback off
+        # the calling thread instead of QueueHandler doing it here
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        self.queue.put_nowait((self.targets, record))
+
+
+class _RoutingQueueListener(QueueListener):
+    """Background writer that sends each queued record to its logger's original handlers."""
+
+    def handle(self, item):
+        targets, record = item
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+# Single background thread that performs all handler I/O; see enable_queued_logging
+_listener: Optional[_RoutingQueueListener] = None
+
+
+def stop_queued_logging():
+    """Stop the background log writer after draining queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def enable_queued_logging():
+    """
+    Move every configured logger's handlers behind a QueueHandler.
+
+    Logging calls then only enqueue the record; file and console writes happen
+    on one listener thread. Call after each dictConfig, which replaces handlers.
+    """
+    global _listener
+    stop_queued_logging()
+    log_queue = queue.SimpleQueue()
+    loggers = [logging.getLogger()] + [
+        obj for obj in logging.root.manager.loggerDict.values() if isinstance(obj, logging.Logger)
+    ]
+    for logger_obj in loggers:
+        targets = tuple(h for h in logger_obj.handlers if not isinstance(h, QueueHandler))
+        if not targets:
+            continue
+        for handler in targets:
+            logger_obj.removeHandler(handler)
+        logger_obj.addHandler(_RoutingQueueHandler(log_queue, targets))
+    _listener = _RoutingQueueListener(log_queue)
+    _listener.start()
+
+
+def reconfigure_logging(config: dict, version_filter: bool = False):
+    """
+    Apply a dictConfig and put the new handlers behind the queue listener.
+
+    The listener is stopped first: dictConfig closes the old handlers, and
+    records still queued for them would otherwise reopen their files.
+    With version_filter, every handler also gets a VersionFilter so
+    %(version)s resolves even where the config does not attach one.
+    """
+    stop_queued_logging()
+    logging.config.dictConfig(config)
+    if version_filter:
+        loggers = [logging.getLogger()] + [
+            obj for obj in logging.root.manager.loggerDict.values() if isinstance(obj, logging.Logger)
+        ]
+        for logger_obj in loggers:
+            for handler in logger_obj.handlers:
+                handler.addFilter(VersionFilter())
+    enable_queued_logging()
+
+
+# Runs before logging's own shutdown hook (atexit is LIFO), so queued records are written
+atexit.register(stop_queued_logging)
+
+
 def configure_versioned_logging(config_path: str = "config/logging.yaml"):
-    """Configure logging with version injection in filenames and formatters."""
-    ensure_log_directories()
+    """Configure logging with version injection in filenames and log records."""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
     
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Cached parse; the copy is ours to rewrite before dictConfig consumes it
+        config = load_yaml(config_path)
         
         # Inject version into all filename patterns in handlers
+        log_dirs = set()
+        run_version = get_run_version()
         for handler_name, handler_config in config.get('handlers', {}).items():
             if 'filename' in handler_config:
                 filename = handler_config['filename']
                 # Replace %(version)s placeholder with actual run version
-                versioned_filename = filename % {'version': CURRENT_RUN_VERSION}
+                versioned_filename = filename % {'version': run_version}
                 handler_config['filename'] = versioned_filename
+                log_dirs.add(os.path.dirname(versioned_filename))
         
-        # Configure logging with updated config
-        logging.config.dictConfig(config)
+        # Only the directories the configured handlers write to, each once
+        ensure_log_directories(sorted(d for d in log_dirs if d))
         
-        # Attach VersionFilter to inject 'version' into all records
-        for logger_name, logger_obj in logging.root.manager.loggerDict.items():
-            if isinstance(logger_obj, logging.Logger):
-                for handler in logger_obj.handlers:
-                    handler.addFilter(VersionFilter())
-        for handler in logging.getLogger().handlers:
-            handler.addFilter(VersionFilter())
-            
-        # Replace all formatters with versioned formatters
-        for handler in logging.getLogger().handlers:
-            if hasattr(handler, 'formatter') and handler.formatter:
-                original_fmt = handler.formatter._fmt
-                handler.setFormatter(VersionedFormatter(original_fmt))
-                
-        # Apply versioned formatters to all loggers
-        for logger_name in config.get('loggers', {}):
-            logger = logging.getLogger(logger_name)
-            for handler in logger.handlers:
-                if hasattr(handler, 'formatter') and handler.formatter:
-                    original_fmt = handler.formatter._fmt
-                    handler.setFormatter(VersionedFormatter(original_fmt))
+        # The config's version_filter and buffered file handlers live in this
+        # module. Bind them directly: this runs while the module is still being
+        # imported, so dictConfig cannot resolve them by dotted path yet.
+        for section in ('filters', 'handlers'):
+            for entry_config in config.get(section, {}).values():
+                factory = entry_config.get('()')
+                if isinstance(factory, str) and factory.startswith(f"{__name__}."):
+                    entry_config['()'] = globals()[factory.rsplit('.', 1)[1]]
         
-        print(f"✅ Logging configured successfully with version: {CURRENT_RUN_VERSION}")
+        # Configure logging with updated config
+        reconfigure_logging(config)
+        _CONFIGURED = True
+        
+        print(f"✅ Logging configured successfully with version: {run_version}")
         
     except Exception as e:
         print(f"❌ Error configuring logging: {e}")
         # Fallback to basic configuration
         logging.basicConfig(
             level=logging.INFO,
-            format=f"%(asctime)s | [{CURRENT_RUN_VERSION}] | %(name)s | %(levelname)s | %(message)s"
+            format=f"%(asctime)s | [{get_run_version()}] | %(name)s | %(levelname)s | %(message)s"
         )
 
+
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> ETLLoggerAdapter:
-    """Get logger with ETL-specific methods and version injection."""
+    """Get logger with ETL-specific methods and version injection (one adapter per name)."""
     # Get base logger
     base_logger = logging.getLogger(name)
     
@@ -282,28 +336,27 @@ def get_error_logger(error_type: str) -> ETLLoggerAdapter:
     """Get error logger for specific error type."""
     return get_logger(f"biotech_pipeline.errors.{error_type}")
 
-def get_run_version() -> str:
-    """Get current run version."""
-    return CURRENT_RUN_VERSION
-
 def log_execution_time(logger_instance: Optional[logging.Logger] = None):
     """Decorator to log function execution time."""
     def decorator(func):
+        func_logger = logger_instance or get_logger(func.__module__)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            func_logger = logger_instance or get_logger(func.__module__)
-            start_time = time.time()
+            # Monotonic integer clock: cheaper than time.time() and immune to clock changes
+            start = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                func_logger.info(
-                    f"Operation completed: {func.__module__}.{func.__name__} "
-                    f"(duration: {time.time() - start_time:.3f}s)"
-                )
+                if func_logger.isEnabledFor(logging.INFO):
+                    func_logger.info(
+                        "Operation completed: %s.%s (duration: %.3fs)",
+                        func.__module__, func.__name__, (time.perf_counter_ns() - start) / 1e9
+                    )
                 return result
             except Exception as e:
                 func_logger.error(
-                    f"Operation failed: {func.__module__}.{func.__name__} "
-                    f"(duration: {time.time() - start_time:.3f}s) - Error: {e}",
+                    "Operation failed: %s.%s (duration: %.3fs) - Error: %s",
+                    func.__module__, func.__name__, (time.perf_counter_ns() - start) / 1e9, e,
                     exc_info=True
                 )
                 raise
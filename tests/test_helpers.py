@@ -0,0 +1,69 @@
+import pytest
+
+from src.biotech_pipeline.utils.helpers import _close_truncated_json, safe_json_load
+
+FALLBACK = {"website": "", "founders": []}
+
+
+def test_plain_json():
+    assert safe_json_load('{"website": "https://a.com", "founders": ["A"]}') == {
+        "website": "https://a.com", "founders": ["A"]
+    }
+
+
+@pytest.mark.parametrize("text", [
+    '```json\n{"website": "https://a.com"}\n```',
+    '```\n{"website": "https://a.com"}\n```',
+    'Here you go:\n```JSON\n{"website": "https://a.com"}\n```\nLet me know if you need more.',
+    # Unterminated fence runs to the end of the text
+    '```json\n{"website": "https://a.com"}',
+])
+def test_fenced_json(text):
+    assert safe_json_load(text) == {"website": "https://a.com"}
+
+
+@pytest.mark.parametrize("text", [
+    'Sure! The profile is {"website": "https://a.com"} as requested.',
+    '{"website": "https://a.com"} -- extracted from the homepage',
+    'Result:\n{"website": "https://a.com"}\n\nNotes: {not json}',
+])
+def test_json_wrapped_in_prose(text):
+    assert safe_json_load(text) == {"website": "https://a.com"}
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"website": "https://a.com", "founders": ["A", "B"', {"website": "https://a.com", "founders": ["A", "B"]}),
+    ('{"website": "https://a.com", "founders": ["A", "B",', {"website": "https://a.com", "founders": ["A", "B"]}),
+    ('{"website": "https://a.com", "founders": [{"name": "A"', {"website": "https://a.com", "founders": [{"name": "A"}]}),
+    ('{"founders": ["Ann", "Bo', {"founders": ["Ann", "Bo"]}),
+    ('{"website": "https://a.com",', {"website": "https://a.com"}),
+    ('{"summary": "uses [brackets] and {braces}", "n": [1, 2', {"summary": "uses [brackets] and {braces}", "n": [1, 2]}),
+])
+def test_truncated_objects_and_arrays(text, expected):
+    assert safe_json_load(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"name": "Acme \\"Bio', {"name": 'Acme "Bio'}),
+    ('{"name": "Acme\\', {"name": "Acme"}),
+    ('{"name": "Acme\\u00', {"name": "Acme"}),
+    ('{"name": "Acme\\u00e9", "city": "Pu\\', {"name": "Acmeé", "city": "Pu"}),
+    ('{"path": "C:\\\\', {"path": "C:\\"}),
+])
+def test_string_cut_off_mid_escape(text, expected):
+    assert safe_json_load(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "no json here",
+    "{website: https://a.com}",
+    '{"website": }',
+    "```json\nnot json\n```",
+])
+def test_invalid_input_returns_fallback(text):
+    assert safe_json_load(text) == FALLBACK
+
+
+def test_close_truncated_json_leaves_complete_json_alone():
+    assert _close_truncated_json('{"a": [1, {"b": "x]"}]}') == '{"a": [1, {"b": "x]"}]}'
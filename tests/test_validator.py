@@ -0,0 +1,52 @@
+import random
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from src.biotech_pipeline.processors.validator import validator
+
+# Cell values covering every validator's fast and slow paths
+SAMPLE_VALUES = [
+    None, float("nan"), "", "x", "a" * 300, 5, 2020, "2020", "20201", "abcd", ["a"], "１２３４",
+    "example.com", "http://example.com", "https://Example.COM/path?q=1", "ftp://x.com",
+    "http://localhost:8080/",
+    "U12345KA2010PTC123456", "u12345ka2010ptc123456 ", "UU1234KA2010PTC123456",
+    "2020-01-02", "2020-01-02 10:11:12", "02/01/2020", "12/31/2020", "31-12-2020", "2020-1-2",
+    "2023-W01-1", "2020-13-45", "2020-02-30 25:61:00",
+    "2020-01-02T10:00:00+05:30", "2020-01-02T10:00:00Z", "2020-01-02 10:00:00-08:00",
+    date(2020, 1, 2), datetime(2020, 1, 2, 3, 4),
+]
+
+
+def _failures(results):
+    return sorted(
+        (r.field, r.message, r.severity.name, repr(r.suggested_value))
+        for r in results if not r.is_valid
+    )
+
+
+def _random_frame(rng, fields, rows=25):
+    records = [
+        {f: rng.choice(SAMPLE_VALUES) for f in fields if rng.random() < 0.9}
+        for _ in range(rows)
+    ]
+    return pd.DataFrame(records)
+
+
+@pytest.mark.parametrize("entity_type", sorted(validator.validators))
+@pytest.mark.parametrize("seed", range(5))
+def test_validate_frame_matches_validate_entity(entity_type, seed):
+    rng = random.Random(seed)
+    df = _random_frame(rng, list(validator.validators[entity_type]))
+
+    got = {label: _failures(results) for label, results in validator.validate_frame(entity_type, df).items()}
+
+    expected = {}
+    for label, row in df.iterrows():
+        record = {k: (None if pd.isna(v) is True else v) for k, v in row.items()}
+        failures = _failures(validator.validate_entity(entity_type, record))
+        if failures:
+            expected[label] = failures
+
+    assert got == expected